@@ -13,134 +13,562 @@ Changes made:
 """
 
 import os
-import json
+import re
+import asyncio
+import httpx
+import msgspec
+import orjson
 import requests
+import zstandard
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import AbstractSet, Dict, List, Optional, Any, Callable
 
 GITHUB_ORG = "deepseek-ai"
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
 FEISHU_WEBHOOK_URL = os.getenv("FEISHU_WEBHOOK_URL")
-STATE_FILE = "/tmp/deepseek_monitor_state.json"
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+STATE_FILE = "/tmp/deepseek_monitor_state.json.zst"  # zstd-compressed JSON snapshot
+LEGACY_STATE_FILE = "/tmp/deepseek_monitor_state.json"  # uncompressed snapshot from older versions
+STATE_LOG_FILE = "/tmp/deepseek_monitor_state.log"  # append-only events since the last snapshot
+STATE_LOG_MAX_BYTES = 1024 * 1024  # compact the log into STATE_FILE once it grows past this
+STATE_DEBUG = bool(os.getenv("MONITOR_DEBUG"))  # also dump the full state as readable JSON each run
+STATE_DEBUG_FILE = "/tmp/deepseek_monitor_state.debug.json"  # uncompressed copy written when STATE_DEBUG is set
+STATE_ZSTD_LEVEL = 3
 PER_PAGE = 100  # pagination size
+MAX_CONCURRENCY = 10  # parallel GitHub requests, keeps us polite with rate limits
+POOL_SIZE = 20  # pooled keep-alive connections per host
+FEISHU_BATCH_SIZE = 10  # events merged into one Feishu message
+FEISHU_MAX_BODY_BYTES = 18 * 1024  # Feishu rejects request bodies over 20 KB; keep a margin
+GRAPHQL_REPO_PAGE = 50  # repos per GraphQL page
+GRAPHQL_ITEM_LIMIT = 100  # latest releases/tags fetched per repo via GraphQL; repos with more go through REST
+
+# One query returns a page of org repos together with their latest releases and tags.
+ORG_GRAPHQL_QUERY = """
+query($org: String!, $cursor: String, $repoPage: Int!, $items: Int!) {
+  organization(login: $org) {
+    repositories(first: $repoPage, after: $cursor, orderBy: {field: NAME, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name databaseId nameWithOwner description url createdAt updatedAt pushedAt
+        primaryLanguage { name }
+        stargazerCount forkCount
+        watchers { totalCount }
+        issues(states: OPEN) { totalCount }
+        releases(first: $items, orderBy: {field: CREATED_AT, direction: DESC}) {
+          pageInfo { hasNextPage }
+          nodes { databaseId tagName name publishedAt url description author { login } }
+        }
+        refs(refPrefix: "refs/tags/", first: $items, orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) {
+          pageInfo { hasNextPage }
+          nodes { name target { ...commitFields ... on Tag { target { ...commitFields } } } }
+        }
+      }
+    }
+  }
+}
+fragment commitFields on GitObject {
+  oid
+  ... on Commit { url message author { name date } }
+}
+"""
+
+
+# Typed views of the GitHub payloads: only the fields the monitor reads are decoded.
+class Repo(msgspec.Struct):
+    name: str
+    id: int
+    full_name: Optional[str] = None
+    description: Optional[str] = None
+    html_url: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    pushed_at: Optional[str] = None
+    language: Optional[str] = None
+    stargazers_count: Optional[int] = None
+    watchers_count: Optional[int] = None
+    forks_count: Optional[int] = None
+    open_issues_count: Optional[int] = None
+
+
+class ReleaseAuthor(msgspec.Struct):
+    login: Optional[str] = None
+
+
+class Release(msgspec.Struct):
+    id: int
+    tag_name: str = ""
+    name: Optional[str] = None
+    published_at: Optional[str] = None
+    author: Optional[ReleaseAuthor] = None
+    body: Optional[str] = None
+    html_url: Optional[str] = None
+
+
+class CommitAuthor(msgspec.Struct):
+    name: Optional[str] = None
+    date: Optional[str] = None
+
+
+class CommitInfo(msgspec.Struct):
+    message: Optional[str] = None
+    author: Optional[CommitAuthor] = None
+
+
+class CommitDetails(msgspec.Struct):
+    html_url: Optional[str] = None
+    commit: CommitInfo = msgspec.field(default_factory=CommitInfo)
+
+
+class TagCommit(msgspec.Struct):
+    sha: str = ""
+    url: Optional[str] = None
+
+
+class Tag(msgspec.Struct):
+    name: str
+    commit: TagCommit = msgspec.field(default_factory=TagCommit)
+    commit_details: Optional[CommitDetails] = None  # only set by the GraphQL path
+
+
+REPOS_DECODER = msgspec.json.Decoder(List[Repo])
+RELEASES_DECODER = msgspec.json.Decoder(List[Release])
+TAGS_DECODER = msgspec.json.Decoder(List[Tag])
+COMMIT_DECODER = msgspec.json.Decoder(CommitDetails)
+
+
+# Derived lookup sets rebuilt on load (never persisted) so de-dup checks are O(1).
+# They are built once and then only updated in place by apply_state_event.
+STATE_INDEX_KEYS = ("repo_names", "release_ids", "release_tag_names", "tag_names")
+NO_KEYS: AbstractSet = frozenset()
+
+
+def index_state(state: Dict) -> None:
+    """Build the lookup sets from the persisted repo/release/tag lists."""
+    state["repo_names"] = {r["name"] for r in state["repos"]}
+    state["release_ids"] = {repo: {r["id"] for r in v} for repo, v in state["releases"].items()}
+    state["release_tag_names"] = {repo: {r["tag_name"] for r in v if r.get("tag_name")} for repo, v in state["releases"].items()}
+    state["tag_names"] = {repo: {t["name"] for t in v} for repo, v in state["tags"].items()}
+
+
+def apply_state_event(state: Dict, event: Dict) -> None:
+    """Apply one state event (new repo / release / tag, or refreshed ETag cache entry) in memory."""
+    kind = event["type"]
+    if kind == "repo":
+        repos = state["repos"]
+        entry = {"name": event["name"], "id": event["id"], "pushed_at": event.get("pushed_at")}
+        if event["name"] not in state["repo_names"]:
+            state["repo_names"].add(event["name"])
+            repos.append(entry)
+            return
+        for i, r in enumerate(repos):
+            if r["name"] == event["name"]:
+                repos[i] = entry
+                break
+    elif kind == "release":
+        repo = event["repo"]
+        known_ids = state["release_ids"].setdefault(repo, set())
+        if event["id"] not in known_ids:
+            known_ids.add(event["id"])
+            state["releases"].setdefault(repo, []).append({"id": event["id"], "tag_name": event["tag_name"]})
+            if event["tag_name"]:
+                state["release_tag_names"].setdefault(repo, set()).add(event["tag_name"])
+    elif kind == "tag":
+        repo = event["repo"]
+        known_names = state["tag_names"].setdefault(repo, set())
+        if event["name"] not in known_names:
+            known_names.add(event["name"])
+            state["tags"].setdefault(repo, []).append({"name": event["name"], "commit": event["commit"]})
+    elif kind == "etag":
+        state["etags"][event["key"]] = {
+            "etag": event["etag"], "last_modified": event.get("last_modified"),
+            "last_page": event.get("last_page"), "data": event["data"],
+        }
+
+
+def record_state_events(log, state: Dict, events: List[Dict]) -> None:
+    """Apply events to the in-memory state and append them to the state log right away."""
+    if not events:
+        return
+    for event in events:
+        apply_state_event(state, event)
+    log.write(b"".join(orjson.dumps(event) + b"\n" for event in events))
+    log.flush()
+
+
+# GitHub API headers, computed once at import
+HEADERS = {"Accept": "application/vnd.github.v3+json"}
+if GITHUB_TOKEN:
+    HEADERS["Authorization"] = f"token {GITHUB_TOKEN}"
+
+
+def _make_session() -> requests.Session:
+    """Session with keep-alive pooling and retries on failed connections (used for Feishu).
+
+    Status codes are not retried: a webhook POST is not idempotent, so a 5xx retry could post twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    )
+    session.mount("https://open.feishu.cn", adapter)
+    return session
+
+
+SESSION = _make_session()
+
+
+def _read_snapshot() -> bytes:
+    """Read the snapshot's JSON bytes, falling back to the uncompressed file older versions wrote."""
+    try:
+        with open(STATE_FILE, "rb") as f:
+            raw = f.read()
+        return zstandard.ZstdDecompressor().decompress(raw) if raw else b""
+    except FileNotFoundError:
+        with open(LEGACY_STATE_FILE, "rb") as f:
+            return f.read()
 
 
 def load_state() -> Dict:
-    """Load previous state from file."""
-    if os.path.exists(STATE_FILE):
-        try:
-            with open(STATE_FILE, "r") as f:
-                state = json.load(f)
-                repo_count = len(state.get("repos", []))
-                release_count = sum(len(v) for v in state.get("releases", {}).values())
-                tag_count = sum(len(v) for v in state.get("tags", {}).values())
-                print(f"[State] Loaded existing state: {repo_count} repos, {release_count} releases, {tag_count} tags")
-                return state
-        except Exception as e:
-            print(f"[State] Failed to load state: {e}")
-            pass
-    print("[State] No existing state found, starting fresh")
-    return {"repos": [], "releases": {}, "tags": {}}
+    """Load the last state snapshot, then replay the event log written since."""
+    state = {"repos": [], "releases": {}, "tags": {}, "etags": {}}
+    found = False
+    # Open directly instead of checking os.path.exists first: one syscall less and no race
+    try:
+        raw = _read_snapshot()
+        if raw:
+            state.update(orjson.loads(raw))
+            found = True
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[State] Failed to load state: {e}")
+    index_state(state)
+
+    replayed = 0
+    try:
+        with open(STATE_LOG_FILE, "rb+") as f:
+            raw = f.read()
+            # Cut off a torn last line from an interrupted run so the next append starts on a fresh line
+            end = raw.rfind(b"\n") + 1
+            if end < len(raw):
+                print(f"[State] Dropping {len(raw) - end} bytes of torn state log tail")
+                f.truncate(end)
+        for line in raw[:end].splitlines():
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            apply_state_event(state, event)
+            replayed += 1
+    except FileNotFoundError:
+        pass
+    found = found or replayed > 0
+
+    if not found:
+        print("[State] No existing state found, starting fresh")
+        return state
+
+    repo_count = len(state.get("repos", []))
+    release_count = sum(len(v) for v in state.get("releases", {}).values())
+    tag_count = sum(len(v) for v in state.get("tags", {}).values())
+    print(f"[State] Loaded existing state: {repo_count} repos, {release_count} releases, {tag_count} tags ({replayed} events replayed)")
+    return state
 
 
 def save_state(state: Dict) -> None:
-    """Save current state to file (atomic-ish)."""
+    """Save current state to file, zstd-compressed (atomic-ish). Derived lookup sets are not persisted."""
+    persisted = {k: v for k, v in state.items() if k not in STATE_INDEX_KEYS}
+    data = orjson.dumps(persisted)
+    data = zstandard.ZstdCompressor(level=STATE_ZSTD_LEVEL).compress(data)
     tmp = STATE_FILE + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(state, f, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(data)
     os.replace(tmp, STATE_FILE)
 
 
-def get_headers() -> Dict:
-    """Get GitHub API headers."""
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-    }
-    github_token = os.getenv("GITHUB_TOKEN")
-    if github_token:
-        headers["Authorization"] = f"token {github_token}"
-    return headers
+def dump_debug_state(state: Dict) -> None:
+    """Write the current state (snapshot plus replayed log) as indented, uncompressed JSON for inspection."""
+    persisted = {k: v for k, v in state.items() if k not in STATE_INDEX_KEYS}
+    with open(STATE_DEBUG_FILE, "wb") as f:
+        f.write(orjson.dumps(persisted, option=orjson.OPT_INDENT_2))
+    print(f"[State] Wrote readable state to {STATE_DEBUG_FILE}")
 
 
-def fetch_repos() -> List[Dict]:
-    """Fetch all repositories for the organization (paginated)."""
-    url = f"{GITHUB_API_BASE}/orgs/{GITHUB_ORG}/repos"
-    headers = get_headers()
-    repos: List[Dict] = []
-    page = 1
+def compact_state(state: Dict) -> None:
+    """Fold the event log into a fresh snapshot once it grows past STATE_LOG_MAX_BYTES."""
+    try:
+        log_size = os.path.getsize(STATE_LOG_FILE)
+    except OSError:
+        return
+    if log_size <= STATE_LOG_MAX_BYTES:
+        return
+    save_state(state)
+    # Replaying events already in the snapshot is harmless, so a crash before truncating is safe
+    open(STATE_LOG_FILE, "w").close()
+    print(f"[State] Compacted {log_size} bytes of state log into snapshot")
 
-    while True:
-        resp = requests.get(url, headers=headers, params={"per_page": PER_PAGE, "page": page})
-        resp.raise_for_status()
-        data = resp.json()
-        if not data:
-            break
-        repos.extend(data)
-        page += 1
 
-    return repos
+def _last_page(resp: httpx.Response) -> Optional[int]:
+    """Page number from the Link: rel="last" header, or None when there is no such link."""
+    last_url = resp.links.get("last", {}).get("url")
+    if not last_url:
+        return None
+    page = httpx.URL(last_url).params.get("page")
+    return int(page) if page and page.isdigit() else None
 
 
-def fetch_releases(repo_name: str) -> List[Dict]:
-    """Fetch releases for a specific repository (paginated)."""
-    url = f"{GITHUB_API_BASE}/repos/{GITHUB_ORG}/{repo_name}/releases"
-    headers = get_headers()
-    releases: List[Dict] = []
-    page = 1
+async def _get_with_etag(client: httpx.AsyncClient, sem: asyncio.Semaphore, etags: Dict, url: str, params: Dict, decoder: msgspec.json.Decoder) -> (list, Optional[int]):
+    """
+    GET a JSON list conditionally for this exact URL+params: If-None-Match with the cached ETag,
+    plus If-Modified-Since with the cached Last-Modified for endpoints that don't ETag reliably.
+    On 200 the raw body is decoded straight into structs and the validators and decoded fields
+    are cached; on 304 the cached fields are converted back without any JSON parsing.
+    Every request holds sem, so parallel pages share the global MAX_CONCURRENCY cap.
+    Returns (items, last page number from the Link header if known).
+    """
+    key = str(httpx.URL(url, params=params))
+    cached = etags.get(key)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    async with sem:
+        resp = await client.get(url, params=params, headers=headers or None)
+        if resp.status_code == 304:
+            if cached:
+                return msgspec.convert(cached["data"], decoder.type), _last_page(resp) or cached.get("last_page")
+            # No cached body to reuse (entry evicted/missing); fall back to an unconditional GET
+            resp = await client.get(url, params=params)
+    resp.raise_for_status()
+    data = decoder.decode(resp.content)
+    last_page = _last_page(resp)
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        etags[key] = {
+            "etag": etag, "last_modified": last_modified, "last_page": last_page, "data": msgspec.to_builtins(data),
+        }
+    else:
+        etags.pop(key, None)
+    return data, last_page
+
+
+async def _fetch_pages(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    etags: Dict,
+    url: str,
+    decoder: msgspec.json.Decoder,
+    is_known: Optional[Callable[[Any], bool]] = None,
+) -> list:
+    """
+    Fetch a paginated GitHub list.
+    Page 1 comes first, then the remaining pages are fetched in parallel up to the Link rel="last"
+    page, or one by one until a short page when GitHub gave no such link.
+    Only fetch_releases passes is_known, for its newest-first list: if every item on page 1
+    is_known, older pages can't hold anything new and are skipped.
+    """
+    def params(page: int) -> Dict:
+        return {"per_page": PER_PAGE, "page": page}
+
+    data, last_page = await _get_with_etag(client, sem, etags, url, params(1), decoder)
+    if not data or (is_known and all(is_known(item) for item in data)):
+        return []
+    items = list(data)
+
+    if last_page:
+        pages = await asyncio.gather(
+            *(_get_with_etag(client, sem, etags, url, params(page), decoder) for page in range(2, last_page + 1))
+        )
+        for page_data, _ in pages:
+            items.extend(page_data)
+        return items
 
-    while True:
-        resp = requests.get(url, headers=headers, params={"per_page": PER_PAGE, "page": page})
-        resp.raise_for_status()
-        data = resp.json()
-        if not data:
-            break
-        releases.extend(data)
+    page = 1
+    while len(data) == PER_PAGE:  # a short page is the last one; skip the empty-page request
         page += 1
+        data, _ = await _get_with_etag(client, sem, etags, url, params(page), decoder)
+        if not data or (is_known and all(is_known(item) for item in data)):
+            break
+        items.extend(data)
+    return items
 
-    return releases
 
+async def fetch_repos(client: httpx.AsyncClient, sem: asyncio.Semaphore, etags: Dict) -> List[Repo]:
+    """Fetch all repositories for the organization (paginated)."""
+    url = f"{GITHUB_API_BASE}/orgs/{GITHUB_ORG}/repos"
+    return await _fetch_pages(client, sem, etags, url, REPOS_DECODER)
 
-def fetch_tags(repo_name: str) -> List[Dict]:
-    """Fetch tags for a specific repository (paginated)."""
-    url = f"{GITHUB_API_BASE}/repos/{GITHUB_ORG}/{repo_name}/tags"
-    headers = get_headers()
-    tags: List[Dict] = []
-    page = 1
 
-    while True:
-        resp = requests.get(url, headers=headers, params={"per_page": PER_PAGE, "page": page})
-        resp.raise_for_status()
-        data = resp.json()
-        if not data:
-            break
-        tags.extend(data)
-        page += 1
+async def fetch_releases(client: httpx.AsyncClient, sem: asyncio.Semaphore, etags: Dict, repo_name: str, known_ids: AbstractSet[int] = NO_KEYS) -> List[Release]:
+    """
+    Fetch releases for a specific repository (paginated, newest first).
+    Stops when the first page's releases are all in known_ids: older pages can't hold new ones.
+    """
+    url = f"{GITHUB_API_BASE}/repos/{GITHUB_ORG}/{repo_name}/releases"
+    return await _fetch_pages(client, sem, etags, url, RELEASES_DECODER, lambda r: r.id in known_ids)
 
-    return tags
 
+async def fetch_tags(client: httpx.AsyncClient, sem: asyncio.Semaphore, etags: Dict, repo_name: str) -> List[Tag]:
+    """
+    Fetch all tags for a specific repository (paginated).
+    /tags is ordered by ref name rather than by date, so a new tag can land on any page and there is no early stop.
+    """
+    url = f"{GITHUB_API_BASE}/repos/{GITHUB_ORG}/{repo_name}/tags"
+    return await _fetch_pages(client, sem, etags, url, TAGS_DECODER)
 
-def fetch_commit(commit_api_url: str) -> Optional[Dict]:
+
+async def fetch_commit(client: httpx.AsyncClient, sem: asyncio.Semaphore, commit_api_url: str) -> Optional[CommitDetails]:
     """Fetch commit details (if available). Returns None on error."""
     if not commit_api_url:
         return None
-    try:
-        resp = requests.get(commit_api_url, headers=get_headers())
+    async with sem:
+        try:
+            resp = await client.get(commit_api_url)
+            resp.raise_for_status()
+            return COMMIT_DECODER.decode(resp.content)
+        except Exception:
+            return None
+
+
+def _graphql_repo(node: Dict) -> Repo:
+    """Convert a GraphQL repository node into the Repo struct used by detection/formatting."""
+    return Repo(
+        name=node["name"],
+        id=node["databaseId"],
+        full_name=node["nameWithOwner"],
+        description=node.get("description"),
+        html_url=node["url"],
+        created_at=node.get("createdAt"),
+        updated_at=node.get("updatedAt"),
+        pushed_at=node.get("pushedAt"),
+        language=(node.get("primaryLanguage") or {}).get("name"),
+        stargazers_count=node.get("stargazerCount"),
+        watchers_count=(node.get("watchers") or {}).get("totalCount"),
+        forks_count=node.get("forkCount"),
+        open_issues_count=(node.get("issues") or {}).get("totalCount"),
+    )
+
+
+def _graphql_release(node: Dict) -> Release:
+    """Convert a GraphQL release node into a Release struct."""
+    author = node.get("author")
+    return Release(
+        id=node["databaseId"],
+        tag_name=node.get("tagName") or "",
+        name=node.get("name"),
+        published_at=node.get("publishedAt"),
+        author=ReleaseAuthor(login=author.get("login")) if author else None,
+        body=node.get("description"),
+        html_url=node.get("url"),
+    )
+
+
+def _graphql_tag(node: Dict, repo_name: str) -> Tag:
+    """
+    Convert a GraphQL tag ref into a Tag struct.
+    Annotated tags point at a Tag object, so follow it to the commit. Commit details come back
+    in the same query and are attached as commit_details so no extra request is needed.
+    """
+    target = node.get("target") or {}
+    if "target" in target:
+        target = target["target"] or {}
+    sha = target.get("oid", "")
+    commit_url = f"{GITHUB_API_BASE}/repos/{GITHUB_ORG}/{repo_name}/commits/{sha}" if sha else None
+    commit_details = None
+    if target.get("url"):
+        author = target.get("author")
+        commit_details = CommitDetails(
+            html_url=target["url"],
+            commit=CommitInfo(
+                message=target.get("message"),
+                author=CommitAuthor(name=author.get("name"), date=author.get("date")) if author else None,
+            ),
+        )
+    return Tag(name=node["name"], commit=TagCommit(sha=sha, url=commit_url), commit_details=commit_details)
+
+
+async def fetch_org_graphql(client: httpx.AsyncClient) -> (List[Repo], List[tuple]):
+    """
+    Fetch all org repos with their latest releases and tags using GraphQL (requires a token).
+    Returns (repos, results) where results[i] is (releases, tags) for repos[i], or None when repos[i]
+    has more releases or tags than one GraphQL page holds; the caller must fetch those in full over REST.
+    """
+    repos: List[Repo] = []
+    results: List[tuple] = []
+    cursor = None
+
+    while True:
+        variables = {"org": GITHUB_ORG, "cursor": cursor, "repoPage": GRAPHQL_REPO_PAGE, "items": GRAPHQL_ITEM_LIMIT}
+        resp = await client.post(GITHUB_GRAPHQL_URL, json={"query": ORG_GRAPHQL_QUERY, "variables": variables})
         resp.raise_for_status()
-        return resp.json()
-    except Exception:
-        return None
+        payload = resp.json()
+        if payload.get("errors"):
+            raise RuntimeError(f"GraphQL errors: {payload['errors']}")
+
+        repositories = payload["data"]["organization"]["repositories"]
+        for node in repositories["nodes"]:
+            repos.append(_graphql_repo(node))
+            if node["releases"]["pageInfo"]["hasNextPage"] or node["refs"]["pageInfo"]["hasNextPage"]:
+                # Tags are ordered by commit date, so a new tag on an old commit can sit past this page
+                results.append(None)
+                continue
+            releases = [_graphql_release(r) for r in node["releases"]["nodes"]]
+            tags = [_graphql_tag(t, node["name"]) for t in node["refs"]["nodes"]]
+            results.append((releases, tags))
+
+        page_info = repositories["pageInfo"]
+        if not page_info["hasNextPage"]:
+            break
+        cursor = page_info["endCursor"]
 
+    return repos, results
 
-def send_feishu_post(title: str, blocks: List[List[Dict[str, Any]]]) -> None:
+
+async def fetch_tag_commit(client: httpx.AsyncClient, sem: asyncio.Semaphore, tag: Tag) -> Optional[CommitDetails]:
+    """Commit details for a tag, reusing the ones GraphQL already returned when present."""
+    if tag.commit_details:
+        return tag.commit_details
+    return await fetch_commit(client, sem, tag.commit.url)
+
+
+async def process_repo(
+    client: httpx.AsyncClient, sem: asyncio.Semaphore, state: Dict, repo: Repo, with_tags: bool = True, complete: bool = False,
+) -> Optional[tuple]:
     """
-    Send a Feishu 'post' rich message.
-    blocks: list of block rows, each block is a list of elements like {"tag": "text", "text": "..."} or {"tag":"a","text":"...","href":"..."}
+    Fetch releases and tags for one repository.
+    Releases stop paging once page 1 is fully known; tags are always read in full, and only
+    when with_tags is set (tags is then [] otherwise).
+    With complete set every release page is read, so releases older than the known ones are seen too.
+    Returns (releases, tags), or None if fetching failed. Only the ETag cache is modified here.
     """
-    if not FEISHU_WEBHOOK_URL:
-        print("Warning: FEISHU_WEBHOOK_URL not set, skipping Feishu notification")
-        return
+    repo_name = repo.name
+    etags = state["etags"]
+    print(f"Checking {repo_name}...")
+    try:
+        known_ids = NO_KEYS if complete else state["release_ids"].get(repo_name, NO_KEYS)
+        fetches = [fetch_releases(client, sem, etags, repo_name, known_ids)]
+        if with_tags:
+            fetches.append(fetch_tags(client, sem, etags, repo_name))
+        releases, *rest = await asyncio.gather(*fetches)
+        tags = rest[0] if rest else []
+    except Exception as e:
+        print(f"Error fetching {repo_name}: {e}")
+        return None
+    return releases, tags
+
 
-    payload = {
+def _post_payload(title: str, blocks: List[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    return {
         "msg_type": "post",
         "content": {
             "post": {
@@ -152,208 +580,348 @@ def send_feishu_post(title: str, blocks: List[List[Dict[str, Any]]]) -> None:
         }
     }
 
+
+def send_feishu_post(title: str, blocks: List[List[Dict[str, Any]]]) -> None:
+    """
+    Send a Feishu 'post' rich message.
+    blocks: list of block rows, each block is a list of elements like {"tag": "text", "text": "..."} or {"tag":"a","text":"...","href":"..."}
+    """
+    if not FEISHU_WEBHOOK_URL:
+        print("Warning: FEISHU_WEBHOOK_URL not set, skipping Feishu notification")
+        return
+
+    body = orjson.dumps(_post_payload(title, blocks))
     try:
-        resp = requests.post(FEISHU_WEBHOOK_URL, json=payload, timeout=10)
+        resp = SESSION.post(FEISHU_WEBHOOK_URL, data=body, headers={"Content-Type": "application/json"}, timeout=10)
         resp.raise_for_status()
         print(f"Feishu card sent: {title}")
     except Exception as e:
         print(f"Failed to send Feishu card: {e}")
 
 
+def _merge_events(chunk: List[tuple]) -> tuple:
+    """Merge several (title, blocks, is_special) events into one post, each headed by its own title and separated by a rule."""
+    title = f"DeepSeek Monitor: {len(chunk)} updates"
+    if any(is_special for _, _, is_special in chunk):
+        title = f"🚀 {title} (includes special releases)"
+    blocks: List[List[Dict[str, Any]]] = []
+    for i, (event_title, event_blocks, _) in enumerate(chunk):
+        if i:
+            blocks.append([{"tag": "hr"}])
+        blocks.append([{"tag": "text", "text": event_title}])
+        blocks.extend(event_blocks)
+    return title, blocks
+
+
+def send_feishu_batch(notifications: List[tuple]) -> None:
+    """
+    Send queued (title, blocks, is_special) notifications as few Feishu posts as possible:
+    up to FEISHU_BATCH_SIZE events per message, as long as the body stays under FEISHU_MAX_BODY_BYTES.
+    An event too large to share a message is sent on its own.
+    """
+    chunk: List[tuple] = []
+    for event in notifications:
+        candidate = chunk + [event]
+        if chunk and (
+            len(candidate) > FEISHU_BATCH_SIZE
+            or len(orjson.dumps(_post_payload(*_merge_events(candidate)))) > FEISHU_MAX_BODY_BYTES
+        ):
+            _send_chunk(chunk)
+            candidate = [event]
+        chunk = candidate
+    if chunk:
+        _send_chunk(chunk)
+
+
+def _send_chunk(chunk: List[tuple]) -> None:
+    if len(chunk) == 1:
+        title, blocks, _ = chunk[0]
+        send_feishu_post(title, blocks)
+    else:
+        send_feishu_post(*_merge_events(chunk))
+
+
+def _truncate(s: str, n: int) -> str:
+    """Cut s to n characters, marking the cut with '...'."""
+    return s[:n] + ("..." if len(s) > n else "")
+
+
+_SPECIAL_RELEASE_RE = re.compile(r"v3|r2", re.IGNORECASE)
+
+
 def is_special_release(tag_name: str) -> bool:
     """Check if this is a special release (v3 or r2)."""
-    return "v3" in tag_name.lower() or "r2" in tag_name.lower()
+    return _SPECIAL_RELEASE_RE.search(tag_name) is not None
+
+
+def detect_new_repos(current_repos: List[Repo], known_names: AbstractSet[str]) -> List[Repo]:
+    """Detect new repositories by name against the pre-built set of known names."""
+    return [repo for repo in current_repos if repo.name not in known_names]
+
 
+def detect_new_releases(current_releases: List[Release], known_ids: AbstractSet[int]) -> List[Release]:
+    """Detect new releases by release.id against the repo's pre-built set of known ids."""
+    return [r for r in current_releases if r.id not in known_ids]
 
-def detect_new_repos(current_repos: List[Dict], state: Dict) -> List[Dict]:
-    """Detect new repositories by name."""
-    known_repo_names = {repo["name"] for repo in state.get("repos", [])}
-    new_repos = [repo for repo in current_repos if repo["name"] not in known_repo_names]
-    return new_repos
 
+def detect_new_tags(current_tags: List[Tag], known_names: AbstractSet[str]) -> List[Tag]:
+    """Detect new tags by tag.name against the repo's pre-built set of known names."""
+    return [t for t in current_tags if t.name not in known_names]
 
-def detect_new_releases(repo_name: str, current_releases: List[Dict], state: Dict) -> List[Dict]:
-    """Detect new releases for a repository by release.id."""
-    known_releases = state.get("releases", {}).get(repo_name, [])
-    known_ids = {r["id"] for r in known_releases}
-    new_releases = [r for r in current_releases if r["id"] not in known_ids]
-    return new_releases
 
+def _field_rows(fields: List[tuple]) -> List[List[Dict[str, str]]]:
+    """Build one Feishu text row per (label, value) pair."""
+    return [[{"tag": "text", "text": f"{label}: {value}"}] for label, value in fields]
 
-def detect_new_tags(repo_name: str, current_tags: List[Dict], state: Dict) -> List[Dict]:
-    """Detect new tags for a repository by tag.name."""
-    known_tags = state.get("tags", {}).get(repo_name, [])
-    known_names = {t["name"] for t in known_tags}
-    new_tags = [t for t in current_tags if t["name"] not in known_names]
-    return new_tags
 
+def _or_na(value: Any) -> Any:
+    """Show missing values as N/A."""
+    return "N/A" if value is None else value
 
-def format_repo_blocks(repo: Dict) -> (str, List[List[Dict[str, str]]]):
-    """Format repository into Feishu post blocks."""
-    title = f"🆕 New Repository: {repo['name']}"
+
+def format_repo_blocks(repo: Repo) -> (str, List[List[Dict[str, str]]], bool):
+    """Format repository into Feishu post blocks. Returns (title, blocks, is_special); new repos are never special."""
+    title = f"🆕 New Repository: {repo.name}"
     # Build blocks (one row per field)
-    blocks: List[List[Dict[str, str]]] = []
-    def add_field(label: str, value: str):
-        blocks.append([{"tag": "text", "text": f"{label}: {value}"}])
-
-    add_field("Repository", repo.get("full_name", repo["name"]))
-    add_field("Description", repo.get("description") or "N/A")
-    add_field("URL", repo.get("html_url", "N/A"))
-    add_field("Created At", repo.get("created_at", "N/A"))
-    add_field("Updated At", repo.get("updated_at", "N/A"))
-    add_field("Language", repo.get("language", "N/A"))
-    add_field("Stars", str(repo.get("stargazers_count", "N/A")))
-    add_field("Watchers", str(repo.get("watchers_count", "N/A")))
-    add_field("Forks", str(repo.get("forks_count", "N/A")))
-    add_field("Open Issues", str(repo.get("open_issues_count", "N/A")))
+    blocks = _field_rows([
+        ("Repository", repo.full_name or repo.name),
+        ("Description", repo.description or "N/A"),
+        ("URL", _or_na(repo.html_url)),
+        ("Created At", _or_na(repo.created_at)),
+        ("Updated At", _or_na(repo.updated_at)),
+        ("Language", _or_na(repo.language)),
+        ("Stars", _or_na(repo.stargazers_count)),
+        ("Watchers", _or_na(repo.watchers_count)),
+        ("Forks", _or_na(repo.forks_count)),
+        ("Open Issues", _or_na(repo.open_issues_count)),
+    ])
 
     # Add a link block
-    blocks.append([{"tag": "a", "text": "Open repository", "href": repo.get("html_url", "")}])
+    blocks.append([{"tag": "a", "text": "Open repository", "href": repo.html_url or ""}])
 
-    return title, blocks
+    return title, blocks, False
 
 
-def format_release_blocks(release: Dict, repo_name: str) -> (str, List[List[Dict[str, str]]]):
-    """Format release into Feishu post blocks."""
-    tag_name = release.get("tag_name", "unknown")
+def format_release_blocks(release: Release, repo_name: str) -> (str, List[List[Dict[str, str]]], bool):
+    """Format release into Feishu post blocks. Returns (title, blocks, is_special)."""
+    tag_name = release.tag_name or "unknown"
     is_special = is_special_release(tag_name)
     title = f"🚀 Special Release - {repo_name} {tag_name} 🚀" if is_special else f"📦 New Release: {repo_name} {tag_name}"
 
-    blocks: List[List[Dict[str, str]]] = []
-    def add_field(label: str, value: str):
-        blocks.append([{"tag": "text", "text": f"{label}: {value}"}])
-
-    add_field("Repository", f"{GITHUB_ORG}/{repo_name}")
-    add_field("Release Name", release.get("name", tag_name))
-    add_field("Tag", tag_name)
-    add_field("Published At", release.get("published_at", "N/A"))
-    add_field("Author", (release.get("author") or {}).get("login", "N/A"))
+    body = release.body or ""
+    fields = [
+        ("Repository", f"{GITHUB_ORG}/{repo_name}"),
+        ("Release Name", release.name or tag_name),
+        ("Tag", tag_name),
+        ("Published At", _or_na(release.published_at)),
+        ("Author", _or_na(release.author.login if release.author else None)),
+    ]
+    if body:
+        fields.append(("Release Notes", _truncate(body, 800)))
+    fields.append(("URL", _or_na(release.html_url)))
 
-    if release.get("body"):
-        notes = release["body"][:800]
-        if len(release["body"]) > 800:
-            notes += "..."
-        add_field("Release Notes", notes)
+    blocks = _field_rows(fields)
+    blocks.append([{"tag": "a", "text": "View Release", "href": release.html_url or ""}])
 
-    add_field("URL", release.get("html_url", "N/A"))
-    blocks.append([{"tag": "a", "text": "View Release", "href": release.get("html_url", "")}])
-
-    return title, blocks
+    return title, blocks, is_special
 
 
-def format_tag_blocks(tag: Dict, repo_name: str) -> (str, List[List[Dict[str, str]]]):
-    """Format tag into Feishu post blocks, including commit info if available."""
-    tag_name = tag.get("name", "unknown")
+def format_tag_blocks(tag: Tag, repo_name: str, commit_details: Optional[CommitDetails]) -> (str, List[List[Dict[str, str]]], bool):
+    """Format tag into Feishu post blocks, including pre-fetched commit info if available. Returns (title, blocks, is_special)."""
+    tag_name = tag.name
     is_special = is_special_release(tag_name)
     title = f"🏷️ Special Tag: {repo_name} {tag_name}" if is_special else f"🏷️ New Tag: {repo_name} {tag_name}"
 
-    blocks: List[List[Dict[str, str]]] = []
-    def add_field(label: str, value: str):
-        blocks.append([{"tag": "text", "text": f"{label}: {value}"}])
-
-    add_field("Repository", f"{GITHUB_ORG}/{repo_name}")
-    add_field("Tag", tag_name)
-
-    commit = tag.get("commit", {})
-    sha = commit.get("sha", "")
-    add_field("Commit (sha)", sha[:7] if sha else "N/A")
-    # Try fetching commit details to include author/message/date
-    commit_url = commit.get("url")
-    commit_details = fetch_commit(commit_url) if commit_url else None
+    sha = tag.commit.sha
+    fields = [
+        ("Repository", f"{GITHUB_ORG}/{repo_name}"),
+        ("Tag", tag_name),
+        ("Commit (sha)", sha[:7] if sha else "N/A"),
+    ]
+    links: List[List[Dict[str, str]]] = []
     if commit_details:
-        author_name = (commit_details.get("commit", {}).get("author") or {}).get("name", "N/A")
-        commit_date = (commit_details.get("commit", {}).get("author") or {}).get("date", "N/A")
-        commit_msg = (commit_details.get("commit", {}).get("message", "") or "")[:500]
-        add_field("Commit Author", author_name)
-        add_field("Commit Date", commit_date)
+        author = commit_details.commit.author or CommitAuthor()
+        commit_msg = commit_details.commit.message or ""
+        fields.append(("Commit Author", _or_na(author.name)))
+        fields.append(("Commit Date", _or_na(author.date)))
         if commit_msg:
-            add_field("Commit Message", commit_msg if len(commit_msg) <= 500 else commit_msg[:500] + "...")
+            fields.append(("Commit Message", _truncate(commit_msg, 500)))
         # add web link to commit (if present)
-        html_url = commit_details.get("html_url")
-        if html_url:
-            blocks.append([{"tag": "a", "text": "View Commit", "href": html_url}])
+        if commit_details.html_url:
+            links.append([{"tag": "a", "text": "View Commit", "href": commit_details.html_url}])
     else:
         # fallback to commit API URL or repo page
-        add_field("Commit URL", commit_url or "N/A")
-
-    return title, blocks
-
+        fields.append(("Commit URL", tag.commit.url or "N/A"))
 
-def main() -> None:
-    """Main monitoring function."""
-    print(f"[{datetime.now().isoformat()}] Starting DeepSeek GitHub Monitor...")
-
-    state = load_state()
+    return title, _field_rows(fields) + links, is_special
 
-    try:
-        repos = fetch_repos()
-    except Exception as e:
-        print(f"Failed to fetch repos: {e}")
-        return
 
-    print(f"Found {len(repos)} repositories")
-
-    # Detect new repositories
-    new_repos = detect_new_repos(repos, state)
-    for repo in new_repos:
-        title, blocks = format_repo_blocks(repo)
-        send_feishu_post(title, blocks)
-        print(f"New repo detected: {repo['name']}")
-
-    # Update repos state
-    state["repos"] = [{"name": r["name"], "id": r["id"]} for r in repos]
-
-    # For each repo, check releases and tags
-    for repo in repos:
-        repo_name = repo["name"]
-        print(f"Checking {repo_name}...")
+def detect_and_notify(
+    repos: List[Repo], results: List[Optional[tuple]], state: Dict, log, notifications: List[tuple],
+    prev_pushed_at: Dict[str, Optional[str]],
+) -> List[tuple]:
+    """
+    Detect new releases/tags from fetched results, queue release notifications and record them in state.
+    A repo's pushed_at is only recorded (when it differs from prev_pushed_at) once it was processed without errors.
+    Returns (repo_name, tag) pairs for new tags; those are notified once commit details are fetched.
+    """
+    new_tag_notifications: List[tuple] = []
+    for repo, result in zip(repos, results):
+        if result is None:
+            continue
+        repo_name = repo.name
+        releases, tags = result
 
         try:
-            releases = fetch_releases(repo_name)
-            new_releases = detect_new_releases(repo_name, releases, state)
+            new_releases = detect_new_releases(releases, state["release_ids"].get(repo_name, NO_KEYS))
 
             # Notify new releases
             for release in new_releases:
-                title, blocks = format_release_blocks(release, repo_name)
-                send_feishu_post(title, blocks)
-                print(f"New release detected: {repo_name} {release.get('tag_name')}")
+                notifications.append(format_release_blocks(release, repo_name))
+                print(f"New release detected: {repo_name} {release.tag_name}")
 
-            # Always update state["releases"][repo_name] to the current list (possibly empty)
-            state["releases"][repo_name] = [{"id": r["id"], "tag_name": r.get("tag_name", "")} for r in releases]
+            state["releases"].setdefault(repo_name, [])
+            record_state_events(log, state, [
+                {"type": "release", "repo": repo_name, "id": r.id, "tag_name": r.tag_name}
+                for r in new_releases
+            ])
 
             # Tags
-            tags = fetch_tags(repo_name)
-            # Build a set of tag names that correspond to releases already known or newly detected in this run
-            release_tag_names_in_state = {r["tag_name"] for r in state.get("releases", {}).get(repo_name, []) if r.get("tag_name")}
-            # Include newly found releases in this run (so we don't notify their tags twice)
-            release_tag_names_in_run = {r.get("tag_name") for r in new_releases if r.get("tag_name")}
-            notified_tag_names = release_tag_names_in_state.union(release_tag_names_in_run)
-
-            # Detect new tags by comparing to state tags (names)
-            known_tags = state.get("tags", {}).get(repo_name, [])
-            known_tag_names = {t["name"] for t in known_tags}
-            new_tags = [t for t in tags if t["name"] not in known_tag_names]
+            # Release tag names already include this run's new releases (recorded above),
+            # so a single set lookup covers both known and newly notified releases
+            release_tag_names = state["release_tag_names"].get(repo_name, NO_KEYS)
+            new_tags = detect_new_tags(tags, state["tag_names"].get(repo_name, NO_KEYS))
 
             for tag in new_tags:
-                tag_name = tag.get("name")
-                if tag_name in notified_tag_names:
+                tag_name = tag.name
+                if tag_name in release_tag_names:
                     # Skip tags that are already covered by releases (either in state or new in this run)
                     print(f"Skipping tag {tag_name} for {repo_name} because it matches a release tag")
                     continue
-                title, blocks = format_tag_blocks(tag, repo_name)
-                send_feishu_post(title, blocks)
-                print(f"New tag detected: {repo_name} {tag_name}")
+                new_tag_notifications.append((repo_name, tag))
+
+            state["tags"].setdefault(repo_name, [])
+            record_state_events(log, state, [
+                {"type": "tag", "repo": repo_name, "name": t.name, "commit": t.commit.sha}
+                for t in new_tags
+            ])
 
-            # Always update state tags (possibly empty)
-            state["tags"][repo_name] = [{"name": t["name"], "commit": t.get("commit", {}).get("sha", "")} for t in tags]
+            if repo.pushed_at != prev_pushed_at.get(repo_name):
+                record_state_events(log, state, [
+                    {"type": "repo", "name": repo_name, "id": repo.id, "pushed_at": repo.pushed_at}
+                ])
 
         except Exception as e:
             print(f"Error processing {repo_name}: {e}")
 
-    # Save updated state
-    save_state(state)
+    return new_tag_notifications
+
+
+async def run_monitor(state: Dict, log) -> None:
+    """Fetch everything concurrently, then detect changes and update state in this coroutine."""
+    etags = state["etags"]
+    etags_before = {key: (entry["etag"], entry.get("last_modified")) for key, entry in etags.items()}
+    notifications: List[tuple] = []  # (title, blocks, is_special), sent together at the end of the run
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    # One pooled keep-alive client for every GitHub call; the transport retries failed connects
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE),
+    )
+    async with httpx.AsyncClient(transport=transport, headers=HEADERS, timeout=10) as client:
+        results = None
+        # GraphQL needs an authenticated client; fall back to REST without a token or on failure
+        if GITHUB_TOKEN:
+            try:
+                repos, results = await fetch_org_graphql(client)
+            except Exception as e:
+                print(f"GraphQL fetch failed, falling back to REST: {e}")
+
+        if results is None:
+            try:
+                repos = await fetch_repos(client, sem, etags)
+            except Exception as e:
+                print(f"Failed to fetch repos: {e}")
+                return
+
+        print(f"Found {len(repos)} repositories")
+        # pushed_at as of the last run: the baseline for both skipping tag fetches and recording pushed_at
+        prev_pushed_at = {r["name"]: r.get("pushed_at") for r in state["repos"]}
+
+        # Detect new repositories
+        new_repos = detect_new_repos(repos, state["repo_names"])
+        for repo in new_repos:
+            notifications.append(format_repo_blocks(repo))
+            print(f"New repo detected: {repo.name}")
+
+        # Record new repos in state (pushed_at is recorded once their releases/tags were checked)
+        record_state_events(log, state, [{"type": "repo", "name": r.name, "id": r.id} for r in new_repos])
+
+        if results is None:
+            # A repo whose pushed_at hasn't moved since last run cannot have new tags, so skip that fetch.
+            # Releases are always checked: one can be published on an existing tag without a push,
+            # and their page 1 is a cheap 304 with the ETag cache.
+            pushed = [
+                not (prev_pushed_at.get(r.name) and r.pushed_at and r.pushed_at <= prev_pushed_at[r.name])
+                for r in repos
+            ]
+            print(f"{sum(pushed)} repositories pushed since last run")
+            # Fetch releases (and tags where needed) for all repos at once; the semaphore caps parallel requests
+            results = await asyncio.gather(
+                *(process_repo(client, sem, state, r, with_tags=p) for r, p in zip(repos, pushed))
+            )
+        else:
+            # GraphQL only returned the first page of these repos' releases/tags; read them in full over REST
+            # so nothing past that page is missed or later mistaken for new
+            overflow = [i for i, result in enumerate(results) if result is None]
+            if overflow:
+                print(f"{len(overflow)} repositories exceed {GRAPHQL_ITEM_LIMIT} releases or tags, fetching over REST")
+                fetched = await asyncio.gather(
+                    *(process_repo(client, sem, state, repos[i], complete=True) for i in overflow)
+                )
+                for i, result in zip(overflow, fetched):
+                    results[i] = result
+
+        # Persist ETag cache entries refreshed by this run's fetches
+        record_state_events(log, state, [
+            {
+                "type": "etag", "key": key, "etag": entry["etag"], "last_modified": entry.get("last_modified"),
+                "last_page": entry.get("last_page"), "data": entry["data"],
+            }
+            for key, entry in etags.items() if etags_before.get(key) != (entry["etag"], entry.get("last_modified"))
+        ])
+
+        # For each repo, check releases and tags
+        new_tag_notifications = detect_and_notify(repos, results, state, log, notifications, prev_pushed_at)
+
+        # Fetch commit details for all truly-new tags in one batch before formatting
+        commit_details_list = await asyncio.gather(
+            *(fetch_tag_commit(client, sem, tag) for _, tag in new_tag_notifications)
+        )
+
+    for (repo_name, tag), commit_details in zip(new_tag_notifications, commit_details_list):
+        notifications.append(format_tag_blocks(tag, repo_name, commit_details))
+        print(f"New tag detected: {repo_name} {tag.name}")
+
+    # One Feishu post per batch of events instead of one per event
+    send_feishu_batch(notifications)
+
+
+def main() -> None:
+    """Main monitoring function."""
+    print(f"[{datetime.now().isoformat()}] Starting DeepSeek GitHub Monitor...")
+
+    state = load_state()
+    with open(STATE_LOG_FILE, "ab") as log:
+        asyncio.run(run_monitor(state, log))
+
+    # Changes are already in the state log; only rewrite the snapshot when the log gets large
+    compact_state(state)
+    if STATE_DEBUG:
+        dump_debug_state(state)
     print(f"[{datetime.now().isoformat()}] Monitor completed")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()